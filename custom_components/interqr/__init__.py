@@ -54,15 +54,23 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok:
         entry_data = hass.data[DOMAIN].pop(entry.entry_id, None)
 
-        # Invalidate the token on the server (best-effort)
+        # Invalidate the token on the server (best-effort) without
+        # holding up the unload on the network round-trip
         if entry_data:
             api: InterQRApiClient = entry_data["api"]
-            try:
-                await api.logout()
-            except Exception:  # noqa: BLE001
-                _LOGGER.debug("Failed to logout during unload (best-effort)")
+            hass.async_create_background_task(
+                _async_logout(api), f"{DOMAIN}_logout_{entry.entry_id}"
+            )
 
         if not hass.data[DOMAIN]:
             hass.data.pop(DOMAIN, None)
 
     return unload_ok
+
+
+async def _async_logout(api: InterQRApiClient) -> None:
+    """Log out of the InterQR API, ignoring any failure."""
+    try:
+        await api.logout()
+    except Exception:  # noqa: BLE001
+        _LOGGER.debug("Failed to logout during unload (best-effort)")
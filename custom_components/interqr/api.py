@@ -2,13 +2,12 @@
 
 from __future__ import annotations
 
-import json
 import logging
-import re
-import uuid as uuid_mod
+import string
 from typing import Any
 
 import aiohttp
+import orjson
 
 from .const import (
     API_TIMEOUT_SECONDS,
@@ -16,24 +15,26 @@ from .const import (
     DEVICE_MANUFACTURER,
     DEVICE_MODEL,
     DEVICE_PLATFORM,
+    EMPTY_DATA,
     ENDPOINT_INIT,
     ENDPOINT_LOGIN,
     ENDPOINT_LOGOUT,
     ENDPOINT_TWOFA_START,
     ENDPOINT_TWOFA_VERIFY,
-    ENDPOINT_UNLOCK,
-    ENDPOINT_UNLOCK_LONG,
     ENDPOINT_USER_DETAILS,
     MAX_RESPONSE_BYTES,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
-# Compiled pattern for lock/device identifier validation.
+# Log calls on the request path use lazy %-args only; wrap any debug output
+# that would need extra work to build in _LOGGER.isEnabledFor(logging.DEBUG).
+
+# Allowed characters for lock/device identifier validation.
 # The InterQR API uses identifiers that are NOT necessarily UUID v4
-# (e.g. "abc-123"), so we use a permissive pattern that still
+# (e.g. "abc-123"), so we use a permissive character set that still
 # prevents path-traversal and injection attacks.
-_SAFE_ID_PATTERN = re.compile(r"^[0-9a-zA-Z\-]+$")
+_ALLOWED_ID_CHARS = frozenset(string.ascii_letters + string.digits + "-")
 
 _REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=API_TIMEOUT_SECONDS)
 
@@ -52,7 +53,7 @@ def _validate_uuid(value: str, label: str = "UUID") -> str:
     Accepts any non-empty string composed of alphanumeric characters and hyphens.
     Raises ValueError if the format is invalid.
     """
-    if not value or not _SAFE_ID_PATTERN.match(value):
+    if not value or not _ALLOWED_ID_CHARS.issuperset(value):
         raise ValueError(f"Invalid {label} format: expected alphanumeric identifier")
     return value
 
@@ -67,12 +68,31 @@ class InterQRApiClient:
         token: str | None = None,
         device_uuid: str | None = None,
     ) -> None:
-        """Initialize the API client."""
+        """Initialize the API client.
+
+        ``session`` should be Home Assistant's shared session from
+        ``async_get_clientsession`` so that every client instance (config
+        flow, reauth and runtime) reuses the same keep-alive connection pool.
+        All requests use the module-level ``_REQUEST_TIMEOUT``.
+        """
         self._session = session
         self._base_url = base_url.rstrip("/")
-        self._token = token
         self._device_uuid = device_uuid
 
+        # Full URLs for the fixed endpoints, built once per client
+        self._url_init = self._base_url + ENDPOINT_INIT
+        self._url_login = self._base_url + ENDPOINT_LOGIN
+        self._url_logout = self._base_url + ENDPOINT_LOGOUT
+        self._url_twofa_start = self._base_url + ENDPOINT_TWOFA_START
+        self._url_twofa_verify = self._base_url + ENDPOINT_TWOFA_VERIFY
+        self._url_user_details = self._base_url + ENDPOINT_USER_DETAILS
+
+        # Request headers are shared across calls and must never be mutated;
+        # the authenticated variant is rebuilt whenever the token changes.
+        self._headers_unauth: dict[str, str] = {"Content-Type": "application/json"}
+        self._headers_auth: dict[str, str] | None = None
+        self.token = token
+
     @property
     def token(self) -> str | None:
         """Return the current auth token."""
@@ -82,6 +102,14 @@ class InterQRApiClient:
     def token(self, value: str | None) -> None:
         """Set the auth token."""
         self._token = value
+        # The Bearer header is formatted once per token, not per request
+        if value:
+            self._headers_auth = {
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {value}",
+            }
+        else:
+            self._headers_auth = None
 
     @property
     def device_uuid(self) -> str | None:
@@ -90,45 +118,64 @@ class InterQRApiClient:
 
     # ── Private helpers ──────────────────────────────────────────────
 
-    def _url(self, endpoint: str) -> str:
-        """Build a full URL from an endpoint path."""
-        return f"{self._base_url}{endpoint}"
-
-    def _auth_headers(self) -> dict[str, str]:
-        """Return headers with Bearer auth token."""
-        headers: dict[str, str] = {"Content-Type": "application/json"}
-        if self._token:
-            headers["Authorization"] = f"Bearer {self._token}"
-        return headers
+    def _endpoint(self, url: str) -> str:
+        """Strip the base URL so logs show only the endpoint path."""
+        return url[len(self._base_url):]
 
     async def _request(
         self,
         method: str,
-        endpoint: str,
+        url: str,
         *,
         json_data: dict | None = None,
         authenticated: bool = False,
+        parse_response: bool = True,
     ) -> dict[str, Any]:
         """Make an API request and return parsed JSON.
 
+        When ``parse_response`` is False the body of a successful response
+        is discarded unread and an empty dict is returned.
+
         Security measures:
         - Enforces a request timeout to prevent indefinite hangs.
         - Limits response body size to prevent memory exhaustion.
         - Validates response Content-Type before JSON parsing.
         """
-        url = self._url(endpoint)
-        headers = self._auth_headers() if authenticated else {"Content-Type": "application/json"}
+        headers = (
+            self._headers_auth
+            if authenticated and self._headers_auth
+            else self._headers_unauth
+        )
 
         try:
             async with self._session.request(
                 method, url, json=json_data, headers=headers, timeout=_REQUEST_TIMEOUT
             ) as response:
+                # ── Check status first — error bodies are never used ──
+                status = response.status
+                if status == 401:
+                    raise InterQRAuthError("Authentication failed")
+
+                if status >= 400:
+                    # Log only status code — never log response body contents
+                    _LOGGER.error(
+                        "InterQR API error: HTTP %s on %s",
+                        status,
+                        self._endpoint(url),
+                    )
+                    raise InterQRConnectionError(f"API error (HTTP {status})")
+
+                if not parse_response:
+                    # Body is left unread; aiohttp closes the connection on
+                    # exit instead of returning it to the keep-alive pool
+                    return {}
+
                 # ── Validate content-type ──
                 content_type = response.headers.get("Content-Type", "")
                 if "application/json" not in content_type:
                     _LOGGER.error(
                         "Unexpected Content-Type from %s: %s",
-                        endpoint,
+                        self._endpoint(url),
                         content_type,
                     )
                     raise InterQRConnectionError(
@@ -136,29 +183,43 @@ class InterQRApiClient:
                     )
 
                 # ── Enforce response size limit ──
-                raw_body = await response.content.read(MAX_RESPONSE_BYTES + 1)
-                if len(raw_body) > MAX_RESPONSE_BYTES:
+                # Reject advertised oversized bodies before reading anything
+                content_length = response.content_length
+                if content_length is not None and content_length > MAX_RESPONSE_BYTES:
                     raise InterQRConnectionError(
                         "Response body exceeds maximum allowed size"
                     )
 
+                if (
+                    content_length is not None
+                    and "Content-Encoding" not in response.headers
+                ):
+                    # Size is known and within limits — aiohttp stops reading
+                    # at Content-Length. Compressed bodies can inflate past
+                    # the advertised length, so they take the capped path.
+                    raw_body = await response.read()
+                else:
+                    # Unknown or compressed size — read chunks until EOF,
+                    # bailing out as soon as the limit is exceeded
+                    buffer = bytearray()
+                    async for chunk in response.content.iter_any():
+                        buffer += chunk
+                        if len(buffer) > MAX_RESPONSE_BYTES:
+                            raise InterQRConnectionError(
+                                "Response body exceeds maximum allowed size"
+                            )
+                    raw_body = buffer  # orjson parses bytearray without a copy
+
                 try:
-                    data: dict[str, Any] = json.loads(raw_body)
-                except (json.JSONDecodeError, ValueError) as err:
+                    data = orjson.loads(raw_body)
+                except ValueError as err:
                     raise InterQRConnectionError(
                         "Invalid JSON in server response"
                     ) from err
 
-                if response.status == 401:
-                    raise InterQRAuthError("Authentication failed")
-
-                if response.status >= 400:
-                    # Log only status code — never log response body contents
-                    _LOGGER.error(
-                        "InterQR API error: HTTP %s on %s", response.status, endpoint
-                    )
+                if not isinstance(data, dict):
                     raise InterQRConnectionError(
-                        f"API error (HTTP {response.status})"
+                        "Unexpected JSON structure in server response"
                     )
 
                 return data
@@ -170,13 +231,12 @@ class InterQRApiClient:
 
     # ── Auth Flow ────────────────────────────────────────────────────
 
-    async def init_device(self, device_uuid: str | None = None) -> dict[str, Any]:
+    async def init_device(self, device_uuid: str) -> dict[str, Any]:
         """Register a new device with the InterQR server.
 
         POST /api/init
+        The caller generates the device UUID; the server may replace it.
         """
-        if device_uuid is None:
-            device_uuid = str(uuid_mod.uuid4())
         self._device_uuid = device_uuid
 
         payload = {
@@ -188,11 +248,11 @@ class InterQRApiClient:
             "app_version": APP_VERSION,
         }
 
-        result = await self._request("POST", ENDPOINT_INIT, json_data=payload)
+        result = await self._request("POST", self._url_init, json_data=payload)
         _LOGGER.debug("Device init completed successfully")
 
         # Capture device UUID from server if returned
-        resp_uuid = (result.get("data") or {}).get("device_uuid")
+        resp_uuid = (result.get("data") or EMPTY_DATA).get("device_uuid")
         if resp_uuid:
             self._device_uuid = resp_uuid
 
@@ -207,7 +267,7 @@ class InterQRApiClient:
             "number": phone_number,
             "device_uuid": device_uuid,
         }
-        result = await self._request("POST", ENDPOINT_TWOFA_START, json_data=payload)
+        result = await self._request("POST", self._url_twofa_start, json_data=payload)
         _LOGGER.debug("2FA SMS sent successfully")
         return result
 
@@ -231,13 +291,13 @@ class InterQRApiClient:
         if second_auth_token:
             payload["second_auth_token"] = second_auth_token
 
-        result = await self._request("POST", ENDPOINT_TWOFA_VERIFY, json_data=payload)
+        result = await self._request("POST", self._url_twofa_verify, json_data=payload)
 
         # Extract token from response
-        data = result.get("data") or {}
+        data = result.get("data") or EMPTY_DATA
         token = data.get("token")
         if token:
-            self._token = token
+            self.token = token
             _LOGGER.debug("2FA verification succeeded; token acquired")
         else:
             raise InterQRAuthError("No token in verify response")
@@ -254,13 +314,13 @@ class InterQRApiClient:
             raise InterQRAuthError("No device_uuid available for login")
 
         payload = {"device_uuid": uuid_to_use}
-        result = await self._request("POST", ENDPOINT_LOGIN, json_data=payload)
+        result = await self._request("POST", self._url_login, json_data=payload)
 
         # Extract new token
-        data = result.get("data") or {}
+        data = result.get("data") or EMPTY_DATA
         token = data.get("token")
         if token:
-            self._token = token
+            self.token = token
             _LOGGER.debug("Login succeeded; token refreshed")
 
         return result
@@ -274,13 +334,15 @@ class InterQRApiClient:
             return
 
         try:
-            await self._request("POST", ENDPOINT_LOGOUT, authenticated=True)
+            await self._request(
+                "POST", self._url_logout, authenticated=True, parse_response=False
+            )
             _LOGGER.debug("Logout succeeded; token invalidated")
         except (InterQRAuthError, InterQRConnectionError):
             # Best-effort — don't block unload if logout fails
             _LOGGER.debug("Logout request failed (best-effort, ignoring)")
         finally:
-            self._token = None
+            self.token = None
 
     # ── User Data ────────────────────────────────────────────────────
 
@@ -291,7 +353,7 @@ class InterQRApiClient:
         Returns: {data: {locks: [...], apartments: [...], name, ...}}
         """
         return await self._request(
-            "GET", ENDPOINT_USER_DETAILS, authenticated=True
+            "GET", self._url_user_details, authenticated=True
         )
 
     # ── Lock Control ─────────────────────────────────────────────────
@@ -302,8 +364,8 @@ class InterQRApiClient:
         POST /api/locks/{uuid}/unlock
         """
         _validate_uuid(lock_uuid, "lock_uuid")
-        endpoint = ENDPOINT_UNLOCK.format(uuid=lock_uuid)
-        result = await self._request("POST", endpoint, authenticated=True)
+        url = f"{self._base_url}/locks/{lock_uuid}/unlock"  # ENDPOINT_UNLOCK
+        result = await self._request("POST", url, authenticated=True)
         _LOGGER.info("Unlock command sent successfully")
         return result
 
@@ -313,7 +375,7 @@ class InterQRApiClient:
         POST /api/locks/{uuid}/unlock-long
         """
         _validate_uuid(lock_uuid, "lock_uuid")
-        endpoint = ENDPOINT_UNLOCK_LONG.format(uuid=lock_uuid)
-        result = await self._request("POST", endpoint, authenticated=True)
+        url = f"{self._base_url}/locks/{lock_uuid}/unlock-long"  # ENDPOINT_UNLOCK_LONG
+        result = await self._request("POST", url, authenticated=True)
         _LOGGER.info("Long-unlock command sent successfully")
         return result
@@ -9,7 +9,6 @@ import uuid as uuid_mod
 from typing import Any
 from urllib.parse import urlparse
 
-import aiohttp
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
@@ -23,8 +22,8 @@ from .const import (
     CONF_TOKEN,
     CONF_USER_UUID,
     DEFAULT_BASE_URL,
-    DEV_BASE_URL,
     DOMAIN,
+    EMPTY_DATA,
     MAX_2FA_ATTEMPTS,
     PHONE_PATTERN,
     SERVER_CUSTOM,
@@ -56,17 +55,12 @@ STEP_VERIFY_DATA_SCHEMA = vol.Schema(
     }
 )
 
-# ── Private IP / reserved ranges for SSRF prevention ─────────────
-_PRIVATE_NETWORKS = [
-    ipaddress.ip_network("10.0.0.0/8"),
-    ipaddress.ip_network("172.16.0.0/12"),
-    ipaddress.ip_network("192.168.0.0/16"),
-    ipaddress.ip_network("127.0.0.0/8"),
-    ipaddress.ip_network("169.254.0.0/16"),
-    ipaddress.ip_network("::1/128"),
-    ipaddress.ip_network("fc00::/7"),
-    ipaddress.ip_network("fe80::/10"),
-]
+# Compiled patterns for user input validation.
+_PHONE_RE = re.compile(PHONE_PATTERN)
+_CODE_RE = re.compile(VERIFICATION_CODE_PATTERN)
+
+# Dotted-decimal IPv4, or anything containing ":" (IPv6, incl. zone IDs).
+_IP_SHAPED = re.compile(r"^[\d.]+$|:")
 
 
 def _mask_phone(phone: str) -> str:
@@ -78,12 +72,12 @@ def _mask_phone(phone: str) -> str:
 
 def _validate_phone(phone: str) -> bool:
     """Validate phone number matches E.164 format."""
-    return bool(re.match(PHONE_PATTERN, phone))
+    return _PHONE_RE.match(phone) is not None
 
 
 def _validate_code(code: str) -> bool:
     """Validate verification code is 4-8 digits."""
-    return bool(re.match(VERIFICATION_CODE_PATTERN, code))
+    return _CODE_RE.match(code) is not None
 
 
 def _validate_custom_url(url: str) -> str | None:
@@ -104,15 +98,24 @@ def _validate_custom_url(url: str) -> str | None:
     if not parsed.hostname:
         return "invalid_url"
 
-    # Block private / reserved IP ranges (SSRF prevention)
-    try:
-        addr = ipaddress.ip_address(parsed.hostname)
-        for network in _PRIVATE_NETWORKS:
-            if addr in network:
+    # Block private / reserved IP ranges (SSRF prevention).
+    # Only IP-shaped hostnames are parsed; domain names skip the attempt.
+    if _IP_SHAPED.search(parsed.hostname):
+        try:
+            addr = ipaddress.ip_address(parsed.hostname)
+        except ValueError:
+            # Not a valid IP literal after all — treat as a domain name
+            pass
+        else:
+            if (
+                addr.is_private
+                or addr.is_loopback
+                or addr.is_link_local
+                or addr.is_reserved
+                or addr.is_multicast
+                or addr.is_unspecified
+            ):
                 return "private_url_blocked"
-    except ValueError:
-        # hostname is a domain name, not an IP — OK
-        pass
 
     return None
 
@@ -126,6 +129,7 @@ class InterQRConfigFlow(ConfigFlow, domain=DOMAIN):
         """Initialize the config flow."""
         self._base_url: str = DEFAULT_BASE_URL
         self._phone: str = ""
+        self._masked_phone: str = ""
         self._device_uuid: str = ""
         self._second_auth_token: str | None = None
         self._api: InterQRApiClient | None = None
@@ -154,6 +158,7 @@ class InterQRConfigFlow(ConfigFlow, domain=DOMAIN):
                 self._base_url = SERVER_URLS[server]
 
             self._phone = user_input["phone"].strip()
+            self._masked_phone = _mask_phone(self._phone)
 
             # Validate phone number format
             if not errors and not _validate_phone(self._phone):
@@ -163,7 +168,9 @@ class InterQRConfigFlow(ConfigFlow, domain=DOMAIN):
                 # Generate device UUID
                 self._device_uuid = str(uuid_mod.uuid4())
 
-                # Create API client
+                # Create API client on the shared session so init and 2FA
+                # start reuse one keep-alive connection. The two calls stay
+                # sequential: 2FA start needs the device to be registered.
                 session = async_get_clientsession(self.hass)
                 self._api = InterQRApiClient(
                     session=session,
@@ -185,7 +192,7 @@ class InterQRConfigFlow(ConfigFlow, domain=DOMAIN):
                             self._phone, self._device_uuid
                         )
                         # Capture second_auth_token if present
-                        data = twofa_result.get("data") or {}
+                        data = twofa_result.get("data") or EMPTY_DATA
                         self._second_auth_token = data.get("second_auth_token")
                     except InterQRConnectionError:
                         errors["base"] = "cannot_connect"
@@ -230,7 +237,7 @@ class InterQRConfigFlow(ConfigFlow, domain=DOMAIN):
                         second_auth_token=self._second_auth_token,
                     )
 
-                    data = verify_result.get("data") or {}
+                    data = verify_result.get("data") or EMPTY_DATA
                     token = data.get("token")
                     user_uuid = data.get("uuid", "")
 
@@ -243,7 +250,7 @@ class InterQRConfigFlow(ConfigFlow, domain=DOMAIN):
 
                         # Create the config entry
                         return self.async_create_entry(
-                            title=f"InterQR ({_mask_phone(self._phone)})",
+                            title=f"InterQR ({self._masked_phone})",
                             data={
                                 CONF_BASE_URL: self._base_url,
                                 CONF_TOKEN: token,
@@ -262,7 +269,7 @@ class InterQRConfigFlow(ConfigFlow, domain=DOMAIN):
             step_id="verify",
             data_schema=STEP_VERIFY_DATA_SCHEMA,
             errors=errors,
-            description_placeholders={"phone": _mask_phone(self._phone)},
+            description_placeholders={"phone": self._masked_phone},
         )
 
     async def async_step_reauth(
@@ -272,6 +279,7 @@ class InterQRConfigFlow(ConfigFlow, domain=DOMAIN):
         self._base_url = entry_data.get(CONF_BASE_URL, DEFAULT_BASE_URL)
         self._device_uuid = entry_data.get(CONF_DEVICE_UUID, "")
         self._phone = entry_data.get(CONF_PHONE, "")
+        self._masked_phone = _mask_phone(self._phone)
 
         # Try quick re-login with existing device UUID first
         session = async_get_clientsession(self.hass)
@@ -282,7 +290,7 @@ class InterQRConfigFlow(ConfigFlow, domain=DOMAIN):
 
         try:
             login_result = await self._api.login(self._device_uuid)
-            data = login_result.get("data") or {}
+            data = login_result.get("data") or EMPTY_DATA
             token = data.get("token")
             if token:
                 # Token refreshed — update the config entry
@@ -312,6 +320,7 @@ class InterQRConfigFlow(ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             self._phone = user_input.get("phone", self._phone).strip()
+            self._masked_phone = _mask_phone(self._phone)
 
             # Validate phone number format
             if not _validate_phone(self._phone):
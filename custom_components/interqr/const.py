@@ -1,5 +1,7 @@
 """Constants for the InterQR integration."""
 
+from types import MappingProxyType
+
 DOMAIN = "interqr"
 
 # ── API Base URLs ─────────────────────────────────────────────────────
@@ -51,3 +53,7 @@ MAX_RESPONSE_BYTES = 1_048_576  # 1 MB
 MAX_2FA_ATTEMPTS = 5
 PHONE_PATTERN = r"^\+[1-9]\d{6,14}$"  # E.164 format
 VERIFICATION_CODE_PATTERN = r"^\d{4,8}$"  # 4-8 digit numeric code
+
+# ── API Responses ────────────────────────────────────────────────────
+# Shared read-only fallback for responses without a "data" object
+EMPTY_DATA = MappingProxyType({})
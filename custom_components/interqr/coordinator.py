@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
 from datetime import timedelta
 from typing import Any
 
@@ -16,6 +17,35 @@ from .const import DEFAULT_SCAN_INTERVAL, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# This runs on every poll: keep debug arguments cheap, and guard anything
+# that needs real formatting work with _LOGGER.isEnabledFor(logging.DEBUG).
+
+# API values that mean "long unlock allowed" (True also matches 1)
+_TRUTHY = frozenset(("1", "true", True))
+
+
+def _is_truthy(value: Any) -> bool:
+    """Return True if an API flag value means "enabled".
+
+    Only scalar JSON values are looked up; lists and objects are
+    unhashable and never count as enabled.
+    """
+    return isinstance(value, (str, int, float)) and value in _TRUTHY
+
+
+@dataclass(slots=True)
+class InterQRLockData:
+    """Lock fields retained from the user details response."""
+
+    lock_uuid: str
+    description: str | None
+    lock_description: str | None
+    building_description: str | None
+    # Device area: defaults only when building_description is absent
+    suggested_area: str | None
+    is_palgate_lock: str | bool | None
+    allow_long_unlock: bool
+
 
 class InterQRDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator to poll InterQR user/lock data."""
@@ -35,6 +65,8 @@ class InterQRDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             name=DOMAIN,
             update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
             config_entry=config_entry,
+            # Lock data compares by value, so identical polls notify no one
+            always_update=False,
         )
         self.api = api
 
@@ -65,5 +97,23 @@ class InterQRDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             len(locks),
         )
 
-        # Return only the data needed by entities — no PII
-        return {"locks": locks}
+        # Keep only the data needed by entities — no PII
+        lock_list = [
+            InterQRLockData(
+                lock_uuid=lock["lock_uuid"],
+                description=lock.get("description"),
+                lock_description=lock.get("lock_description", "Lock"),
+                building_description=lock.get("building_description"),
+                suggested_area=lock.get("building_description", "InterQR Building"),
+                is_palgate_lock=lock.get("is_palgate_lock"),
+                allow_long_unlock=_is_truthy(lock.get("allow_long_unlock")),
+            )
+            for lock in locks
+            if lock.get("lock_uuid")
+        ]
+
+        # Index by UUID so each entity can find its lock in O(1)
+        return {
+            "locks": lock_list,
+            "locks_by_uuid": {lock.lock_uuid: lock for lock in lock_list},
+        }
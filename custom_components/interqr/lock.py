@@ -2,23 +2,29 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.components.lock import LockEntity, LockEntityFeature
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .api import InterQRApiClient
 from .const import DOMAIN, RELOCK_DELAY
-from .coordinator import InterQRDataCoordinator
+from .coordinator import InterQRDataCoordinator, InterQRLockData
 
 _LOGGER = logging.getLogger(__name__)
 
+# Data is polled centrally by the coordinator and each unlock is an
+# independent API call, so service calls need not be serialized.
+PARALLEL_UPDATES = 0
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -30,14 +36,10 @@ async def async_setup_entry(
     coordinator: InterQRDataCoordinator = data["coordinator"]
     api: InterQRApiClient = data["api"]
 
-    locks_data = coordinator.data.get("locks", [])
-    entities: list[InterQRLock] = []
-
-    for lock_data in locks_data:
-        lock_uuid = lock_data.get("lock_uuid")
-        if not lock_uuid:
-            continue
-        entities.append(InterQRLock(coordinator, api, lock_data))
+    entities = [
+        InterQRLock(coordinator, api, lock_data)
+        for lock_data in coordinator.data["locks_by_uuid"].values()
+    ]
 
     _LOGGER.info("Setting up %d InterQR lock entit(ies)", len(entities))
     async_add_entities(entities)
@@ -52,21 +54,22 @@ class InterQRLock(CoordinatorEntity[InterQRDataCoordinator], LockEntity):
         self,
         coordinator: InterQRDataCoordinator,
         api: InterQRApiClient,
-        lock_data: dict[str, Any],
+        lock_data: InterQRLockData,
     ) -> None:
         """Initialize the lock entity."""
         super().__init__(coordinator)
         self._api = api
-        self._cancel_relock: CALLBACK_TYPE | None = None
-        self._lock_uuid: str = lock_data["lock_uuid"]
+        self._cancel_relock: asyncio.TimerHandle | None = None
+        self._lock_uuid: str = lock_data.lock_uuid
         self._lock_data = lock_data
+        self._last_available = coordinator.last_update_success
 
         # ── Entity identity ──────────────────────────────────────────
-        self._attr_unique_id = f"interqr_{self._lock_uuid}"
+        self._attr_unique_id = "interqr_" + self._lock_uuid
 
         # ── Name: prefer custom description, fall back to lock_description
-        custom_name = lock_data.get("description")
-        lock_desc = lock_data.get("lock_description", "Lock")
+        custom_name = lock_data.description
+        lock_desc = lock_data.lock_description
         self._attr_name = custom_name if custom_name else lock_desc
 
         # ── Lock is always locked (API is unlock-only) ───────────────
@@ -75,56 +78,86 @@ class InterQRLock(CoordinatorEntity[InterQRDataCoordinator], LockEntity):
         self._attr_is_unlocking = False
 
         # ── Supported features ───────────────────────────────────────
-        allow_long = lock_data.get("allow_long_unlock")
-        self._allow_long_unlock = allow_long in ("1", "true", True)
+        self._allow_long_unlock = lock_data.allow_long_unlock
         if self._allow_long_unlock:
             self._attr_supported_features = LockEntityFeature.OPEN
         else:
             self._attr_supported_features = LockEntityFeature(0)
 
         # ── Device info ──────────────────────────────────────────────
-        building_desc = lock_data.get("building_description", "InterQR Building")
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, self._lock_uuid)},
             name=self._attr_name,
             manufacturer="InterQR",
             model=lock_desc,
-            suggested_area=building_desc,
+            suggested_area=lock_data.suggested_area,
         )
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional lock attributes.
+        self._attrs_cache = self._build_attributes()
+
+    def _build_attributes(self) -> Mapping[str, Any]:
+        """Build the read-only extra state attributes from the lock data.
 
         Only user-facing descriptive attributes are exposed;
         internal UUIDs are excluded to reduce information leakage.
         """
-        return {
-            "building_description": self._lock_data.get("building_description"),
-            "is_palgate_lock": self._lock_data.get("is_palgate_lock"),
-            "allow_long_unlock": self._allow_long_unlock,
-        }
+        return MappingProxyType(
+            {
+                "building_description": self._lock_data.building_description,
+                "is_palgate_lock": self._lock_data.is_palgate_lock,
+                "allow_long_unlock": self._allow_long_unlock,
+            }
+        )
+
+    @property
+    def extra_state_attributes(self) -> Mapping[str, Any]:
+        """Return additional lock attributes (rebuilt only on change)."""
+        return self._attrs_cache
+
+    async def async_added_to_hass(self) -> None:
+        """Register cleanup of any pending relock timer on removal."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._async_cancel_relock)
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Update lock data when coordinator refreshes."""
-        locks = self.coordinator.data.get("locks", [])
-        for lock in locks:
-            if lock.get("lock_uuid") == self._lock_uuid:
-                self._lock_data = lock
-                # Update name if custom name changed
-                custom_name = lock.get("description")
-                lock_desc = lock.get("lock_description", "Lock")
-                self._attr_name = custom_name if custom_name else lock_desc
-                break
+        lock = self.coordinator.data["locks_by_uuid"].get(self._lock_uuid)
+        if lock == self._lock_data:
+            lock = None
+        available = self.coordinator.last_update_success
+        if lock is None and available == self._last_available:
+            # Nothing user-visible changed — skip the state write
+            return
+
+        self._last_available = available
+        if lock is not None:
+            self._lock_data = lock
+            self._attrs_cache = self._build_attributes()
+            # Update name if custom name changed
+            custom_name = lock.description
+            lock_desc = lock.lock_description
+            self._attr_name = custom_name if custom_name else lock_desc
         self.async_write_ha_state()
 
     # ── Auto-relock helper ────────────────────────────────────────────
 
     @callback
-    def _async_relock(self, _now: Any) -> None:
+    def _async_cancel_relock(self) -> None:
+        """Cancel a pending auto-relock timer, if any."""
+        if self._cancel_relock is not None:
+            self._cancel_relock.cancel()
+            self._cancel_relock = None
+
+    @callback
+    def _async_relock_now(self) -> None:
         """Return the lock to 'locked' state after the relock delay."""
         self._cancel_relock = None
+        if self._attr_is_locked:
+            # An overlapping unlock failed and already set is_locked while
+            # an earlier unlock's relock timer was pending (possible since
+            # PARALLEL_UPDATES = 0) — nothing left to write
+            return
         self._attr_is_locked = True
         self.async_write_ha_state()
         _LOGGER.debug("Auto-relocked: %s", self._attr_name)
@@ -133,10 +166,9 @@ class InterQRLock(CoordinatorEntity[InterQRDataCoordinator], LockEntity):
     def _schedule_auto_relock(self) -> None:
         """Schedule the lock to return to 'locked' after RELOCK_DELAY."""
         # Cancel any pending relock so we don't stack timers
-        if self._cancel_relock is not None:
-            self._cancel_relock()
-        self._cancel_relock = async_call_later(
-            self.hass, RELOCK_DELAY, self._async_relock
+        self._async_cancel_relock()
+        self._cancel_relock = self.hass.loop.call_later(
+            RELOCK_DELAY, self._async_relock_now
         )
 
     # ── Lock / Unlock actions ────────────────────────────────────────
@@ -198,8 +230,6 @@ class InterQRLock(CoordinatorEntity[InterQRDataCoordinator], LockEntity):
             "Lock command received (unlock-only system, confirming locked)"
         )
         # Cancel any pending auto-relock since we are locking immediately
-        if self._cancel_relock is not None:
-            self._cancel_relock()
-            self._cancel_relock = None
+        self._async_cancel_relock()
         self._attr_is_locked = True
         self.async_write_ha_state()